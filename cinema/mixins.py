@@ -0,0 +1,141 @@
+import functools
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Prefetch
+from rest_framework import relations, serializers
+
+
+class AutoPrefetchViewSetMixin:
+    """
+    Eager-load the relations rendered by the action's serializer.
+
+    Forward foreign keys are joined with select_related(). Each to-many
+    relation becomes a Prefetch whose queryset joins the foreign keys
+    behind it, so a nested relation costs one query instead of one per hop.
+    The lookups are derived once per serializer class. Prefetch paths that
+    get_queryset() sets up itself are listed in custom_prefetch_lookups and
+    left alone. Only read actions are optimized; writes would discard the
+    prefetched relations anyway.
+    """
+
+    prefetch_actions = ("list", "retrieve")
+    custom_prefetch_lookups = ()
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        if self.action not in self.prefetch_actions:
+            return queryset
+
+        select_related, prefetches = self.get_related_lookups(
+            self.get_serializer_class()
+        )
+        prefetches = [
+            (path, *lookups)
+            for path, *lookups in prefetches
+            if not any(
+                path == custom or path.startswith(custom + "__")
+                for custom in self.custom_prefetch_lookups
+            )
+        ]
+
+        if select_related:
+            queryset = queryset.select_related(*select_related)
+        if prefetches:
+            queryset = queryset.prefetch_related(
+                *self.build_prefetches(prefetches)
+            )
+
+        return queryset
+
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def get_related_lookups(cls, serializer_class):
+        serializer = serializer_class()
+        select_related, prefetch_related = {}, {}
+        cls._collect_lookups(
+            serializer, serializer.Meta.model, select_related, prefetch_related
+        )
+        return cls._freeze_lookups(select_related, prefetch_related)
+
+    @classmethod
+    def build_prefetches(cls, prefetches):
+        result = []
+        for path, model, select_related, nested_prefetches in prefetches:
+            queryset = model._default_manager.all()
+            if select_related:
+                queryset = queryset.select_related(*select_related)
+            if nested_prefetches:
+                queryset = queryset.prefetch_related(
+                    *cls.build_prefetches(nested_prefetches)
+                )
+            result.append(Prefetch(path, queryset=queryset))
+        return result
+
+    @classmethod
+    def _collect_lookups(
+        cls, serializer, model, select_related, prefetch_related, path=()
+    ):
+        for field in serializer.fields.values():
+            source_attrs = field.source_attrs
+            if isinstance(field, serializers.ListSerializer):
+                field = field.child
+
+            if (
+                isinstance(field, relations.RelatedField)
+                and field.use_pk_only_optimization()
+            ):
+                continue
+
+            field_model = model
+            field_path = list(path)
+            field_select = select_related
+            field_prefetch = prefetch_related
+            is_relation = False
+
+            for attr in source_attrs:
+                try:
+                    model_field = field_model._meta.get_field(attr)
+                except FieldDoesNotExist:
+                    break
+                if not model_field.is_relation:
+                    break
+
+                is_relation = True
+                field_path.append(attr)
+                field_model = model_field.related_model
+                lookup = "__".join(field_path)
+                if model_field.many_to_many or model_field.one_to_many:
+                    _, field_select, field_prefetch = (
+                        field_prefetch.setdefault(
+                            lookup, (field_model, {}, {})
+                        )
+                    )
+                    field_path = []
+                else:
+                    field_select[lookup] = None
+            else:
+                nested = isinstance(field, serializers.BaseSerializer)
+                if nested and is_relation:
+                    cls._collect_lookups(
+                        field,
+                        field_model,
+                        field_select,
+                        field_prefetch,
+                        field_path,
+                    )
+
+    @classmethod
+    def _freeze_lookups(cls, select_related, prefetch_related):
+        return tuple(select_related), tuple(
+            (path, model) + cls._freeze_lookups(*nested)
+            for path, (model, *nested) in prefetch_related.items()
+        )
+
+
+class SerializerActionClassesMixin:
+    serializer_action_classes = {}
+
+    def get_serializer_class(self):
+        return self.serializer_action_classes.get(
+            self.action, self.serializer_class
+        )
@@ -1,6 +1,15 @@
+from django.db import IntegrityError, transaction
 from rest_framework import serializers
 
-from cinema.models import Genre, Actor, CinemaHall, Movie, MovieSession
+from cinema.models import (
+    Genre,
+    Actor,
+    CinemaHall,
+    Movie,
+    MovieSession,
+    Ticket,
+    Order,
+)
 
 
 class GenreSerializer(serializers.ModelSerializer):
@@ -57,8 +66,9 @@ class MovieSessionListSerializer(MovieSessionSerializer):
         source="cinema_hall.name", read_only=True
     )
     cinema_hall_capacity = serializers.IntegerField(
-        source="cinema_hall.capacity", read_only=True
+        source="capacity", read_only=True
     )
+    tickets_available = serializers.IntegerField(read_only=True)
 
     class Meta:
         model = MovieSession
@@ -68,13 +78,144 @@ class MovieSessionListSerializer(MovieSessionSerializer):
             "movie_title",
             "cinema_hall_name",
             "cinema_hall_capacity",
+            "tickets_available",
         )
 
 
 class MovieSessionDetailSerializer(MovieSessionSerializer):
     movie = MovieListSerializer(many=False, read_only=True)
     cinema_hall = CinemaHallSerializer(many=False, read_only=True)
+    taken_places = serializers.SerializerMethodField()
 
     class Meta:
         model = MovieSession
-        fields = ("id", "show_time", "movie", "cinema_hall")
+        fields = ("id", "show_time", "movie", "cinema_hall", "taken_places")
+
+    def get_taken_places(self, obj):
+        return list(obj.tickets.values("row", "seat"))
+
+
+class TicketSerializer(serializers.ModelSerializer):
+    movie_session = serializers.PrimaryKeyRelatedField(
+        queryset=MovieSession.objects.select_related("cinema_hall")
+    )
+
+    class Meta:
+        model = Ticket
+        fields = ("id", "row", "seat", "movie_session")
+
+
+class TicketMovieSessionSerializer(MovieSessionListSerializer):
+    cinema_hall_capacity = serializers.IntegerField(
+        source="cinema_hall.capacity", read_only=True
+    )
+
+    class Meta(MovieSessionListSerializer.Meta):
+        fields = (
+            "id",
+            "show_time",
+            "movie_title",
+            "cinema_hall_name",
+            "cinema_hall_capacity",
+        )
+
+
+class TicketListSerializer(TicketSerializer):
+    movie_session = TicketMovieSessionSerializer(many=False, read_only=True)
+
+
+class OrderSerializer(serializers.ModelSerializer):
+    tickets = TicketSerializer(many=True, read_only=False, allow_empty=False)
+
+    class Meta:
+        model = Order
+        fields = ("id", "tickets", "created_at")
+
+    def validate(self, attrs):
+        data = super(OrderSerializer, self).validate(attrs=attrs)
+        tickets = attrs["tickets"]
+        movie_sessions = {ticket["movie_session"] for ticket in tickets}
+        taken_places = set(
+            Ticket.objects.filter(
+                movie_session__in=movie_sessions,
+                row__in={ticket["row"] for ticket in tickets},
+                seat__in={ticket["seat"] for ticket in tickets},
+            ).values_list("movie_session_id", "row", "seat")
+        )
+
+        for ticket in tickets:
+            movie_session = ticket["movie_session"]
+            Ticket.validate_ticket(
+                ticket["row"],
+                ticket["seat"],
+                movie_session.cinema_hall,
+                serializers.ValidationError,
+            )
+            place = (movie_session.id, ticket["row"], ticket["seat"])
+            if place in taken_places:
+                raise serializers.ValidationError(
+                    {
+                        "tickets": f"Seat {ticket['seat']} in row "
+                        f"{ticket['row']} is already taken for "
+                        f"movie session {movie_session.id}."
+                    }
+                )
+            taken_places.add(place)
+
+        return data
+
+    def create(self, validated_data):
+        tickets_data = validated_data.pop("tickets")
+        try:
+            with transaction.atomic():
+                order = Order.objects.create(**validated_data)
+                Ticket.objects.bulk_create(
+                    [
+                        Ticket(order=order, **ticket_data)
+                        for ticket_data in tickets_data
+                    ],
+                    batch_size=500,
+                )
+        except IntegrityError:
+            raise serializers.ValidationError(
+                {"tickets": "Some of the selected seats are already taken."}
+            )
+        return order
+
+
+class OrderListSerializer(OrderSerializer):
+    tickets = TicketListSerializer(many=True, read_only=True)
+
+    def to_representation(self, instance):
+        datetime_field = self.fields["created_at"]
+        tickets = getattr(instance, "prefetched_tickets", None)
+        if tickets is None:
+            tickets = instance.tickets.all()
+        return {
+            "id": instance.id,
+            "tickets": [
+                self._ticket_to_representation(ticket, datetime_field)
+                for ticket in tickets
+            ],
+            "created_at": datetime_field.to_representation(
+                instance.created_at
+            ),
+        }
+
+    @staticmethod
+    def _ticket_to_representation(ticket, datetime_field):
+        movie_session = ticket.movie_session
+        return {
+            "id": ticket.id,
+            "row": ticket.row,
+            "seat": ticket.seat,
+            "movie_session": {
+                "id": movie_session.id,
+                "show_time": datetime_field.to_representation(
+                    movie_session.show_time
+                ),
+                "movie_title": movie_session.movie.title,
+                "cinema_hall_name": movie_session.cinema_hall.name,
+                "cinema_hall_capacity": movie_session.cinema_hall.capacity,
+            },
+        }
@@ -1,4 +1,6 @@
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 
 from rest_framework.test import APIClient
 from rest_framework import status
@@ -41,6 +43,19 @@ class MovieApiTests(TestCase):
         for field in titanic:
             self.assertEqual(movies.data[0][field], titanic[field])
 
+    def test_get_movies_query_count(self):
+        for index in range(3):
+            movie = Movie.objects.create(
+                title=f"Movie {index}",
+                description="Description",
+                duration=90,
+            )
+            movie.genres.add(self.drama)
+            movie.actors.add(self.actress)
+        with self.assertNumQueries(3):
+            movies = self.client.get("/api/cinema/movies/")
+        self.assertEqual(len(movies.data), 4)
+
     def test_get_movies_with_genres_filtering(self):
         movies = self.client.get(
             f"/api/cinema/movies/?genres={self.comedy.id}"
@@ -53,6 +68,24 @@ class MovieApiTests(TestCase):
         movies = self.client.get("/api/cinema/movies/?genres=123213")
         self.assertEqual(len(movies.data), 0)
 
+    def test_get_movies_with_several_genres_filtering(self):
+        movies = self.client.get(
+            f"/api/cinema/movies/?genres={self.drama.id},{self.comedy.id}"
+        )
+        self.assertEqual(len(movies.data), 1)
+        movies = self.client.get(
+            f"/api/cinema/movies/?genres={self.drama.id},abc"
+        )
+        self.assertEqual(len(movies.data), 1)
+        movies = self.client.get(
+            f"/api/cinema/movies/?genres={self.drama.id},\u00b2"
+        )
+        self.assertEqual(movies.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(movies.data), 1)
+        movies = self.client.get("/api/cinema/movies/?actors=\u00b2")
+        self.assertEqual(movies.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(movies.data), 0)
+
     def test_get_movies_with_actors_filtering(self):
         movies = self.client.get(
             f"/api/cinema/movies/?actors={self.actress.id}"
@@ -115,6 +148,12 @@ class MovieApiTests(TestCase):
             response.data["actors"][0]["full_name"], "Kate Winslet"
         )
 
+    def test_get_movie_ignores_list_filters(self):
+        response = self.client.get(
+            f"/api/cinema/movies/{self.movie.id}/?genres=999&title=abc"
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
     def test_get_invalid_movie(self):
         response = self.client.get("/api/cinema/movies/100/")
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
@@ -153,3 +192,21 @@ class MovieApiTests(TestCase):
             "/api/cinema/movies/1000/",
         )
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_delete_movie_does_not_prefetch_relations(self):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.delete(
+                f"/api/cinema/movies/{self.movie.id}/"
+            )
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        selects = [
+            query["sql"]
+            for query in context.captured_queries
+            if query["sql"].startswith("SELECT")
+        ]
+        self.assertFalse(
+            any("cinema_movie_genres" in sql for sql in selects)
+        )
+        self.assertFalse(
+            any("cinema_movie_actors" in sql for sql in selects)
+        )
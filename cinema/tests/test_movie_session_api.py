@@ -55,6 +55,34 @@ class MovieSessionApiTests(TestCase):
                 movie_sessions.data[0][field], movie_session[field]
             )
 
+    def test_get_movie_sessions_query_count(self):
+        for hour in range(10, 13):
+            MovieSession.objects.create(
+                movie=self.movie,
+                cinema_hall=self.cinema_hall,
+                show_time=datetime.datetime(
+                    year=2022, month=9, day=2, hour=hour
+                ),
+            )
+        with self.assertNumQueries(1):
+            movie_sessions = self.client.get("/api/cinema/movie_sessions/")
+        self.assertEqual(len(movie_sessions.data), 4)
+        for movie_session in movie_sessions.data:
+            self.assertEqual(movie_session["tickets_available"], 140)
+
+    def test_get_movie_sessions_paginated(self):
+        MovieSession.objects.create(
+            movie=self.movie,
+            cinema_hall=self.cinema_hall,
+            show_time=datetime.datetime(year=2022, month=9, day=3, hour=9),
+        )
+        movie_sessions = self.client.get(
+            "/api/cinema/movie_sessions/?limit=1"
+        )
+        self.assertEqual(movie_sessions.status_code, status.HTTP_200_OK)
+        self.assertEqual(movie_sessions.data["count"], 2)
+        self.assertEqual(len(movie_sessions.data["results"]), 1)
+
     def test_get_movie_sessions_filtered_by_date(self):
         movie_sessions = self.client.get(
             "/api/cinema/movie_sessions/?date=2022-09-02"
@@ -68,6 +96,37 @@ class MovieSessionApiTests(TestCase):
         self.assertEqual(movie_sessions.status_code, status.HTTP_200_OK)
         self.assertEqual(len(movie_sessions.data), 0)
 
+    def test_get_movie_sessions_filtered_by_date_day_bounds(self):
+        for day, hour, minute in ((2, 23, 59), (3, 0, 0)):
+            MovieSession.objects.create(
+                movie=self.movie,
+                cinema_hall=self.cinema_hall,
+                show_time=datetime.datetime(
+                    year=2022, month=9, day=day, hour=hour, minute=minute
+                ),
+            )
+        movie_sessions = self.client.get(
+            "/api/cinema/movie_sessions/?date=2022-09-02"
+        )
+        self.assertEqual(movie_sessions.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(movie_sessions.data), 2)
+
+    def test_get_movie_sessions_filtered_by_invalid_date(self):
+        movie_sessions = self.client.get(
+            "/api/cinema/movie_sessions/?date=2022-13-02"
+        )
+        self.assertEqual(
+            movie_sessions.status_code, status.HTTP_400_BAD_REQUEST
+        )
+
+    def test_get_movie_sessions_filtered_by_invalid_movie(self):
+        movie_sessions = self.client.get(
+            "/api/cinema/movie_sessions/?movie=abc"
+        )
+        self.assertEqual(
+            movie_sessions.status_code, status.HTTP_400_BAD_REQUEST
+        )
+
     def test_get_movie_sessions_filtered_by_movie(self):
         movie_sessions = self.client.get(
             f"/api/cinema/movie_sessions/?movie={self.movie.id}"
@@ -100,6 +159,13 @@ class MovieSessionApiTests(TestCase):
         self.assertEqual(movie_sessions.status_code, status.HTTP_200_OK)
         self.assertEqual(len(movie_sessions.data), 0)
 
+    def test_get_movie_session_ignores_list_filters(self):
+        response = self.client.get(
+            f"/api/cinema/movie_sessions/{self.movie_session.id}/"
+            "?date=bad&movie=999"
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
     def test_post_movie_session(self):
         movies = self.client.post(
             "/api/cinema/movie_sessions/",
@@ -127,3 +193,10 @@ class MovieSessionApiTests(TestCase):
         self.assertEqual(response.data["cinema_hall"]["rows"], 10)
         self.assertEqual(response.data["cinema_hall"]["seats_in_row"], 14)
         self.assertEqual(response.data["cinema_hall"]["name"], "White")
+
+    def test_get_movie_session_query_count(self):
+        with self.assertNumQueries(4):
+            response = self.client.get(
+                f"/api/cinema/movie_sessions/{self.movie_session.id}/"
+            )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
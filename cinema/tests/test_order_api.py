@@ -5,6 +5,7 @@ from django.test import TestCase
 from rest_framework.test import APIClient
 from rest_framework import status
 
+from cinema.mixins import AutoPrefetchViewSetMixin
 from cinema.models import (
     Movie,
     Genre,
@@ -14,6 +15,7 @@ from cinema.models import (
     Ticket,
     Order,
 )
+from cinema.serializers import OrderListSerializer, TicketListSerializer
 from user.models import User
 
 
@@ -68,6 +70,19 @@ class OrderApiTests(TestCase):
         self.assertEqual(movie_session["cinema_hall_name"], "White")
         self.assertEqual(movie_session["cinema_hall_capacity"], 140)
 
+    def test_order_list_representation_matches_nested_serializers(self):
+        data = OrderListSerializer(self.order).data
+        self.assertEqual(data["id"], self.order.id)
+        self.assertEqual(
+            data["tickets"], [TicketListSerializer(self.ticket).data]
+        )
+        self.assertEqual(
+            data["created_at"],
+            OrderListSerializer().fields["created_at"].to_representation(
+                self.order.created_at
+            ),
+        )
+
     def test_movie_session_detail_tickets(self):
         response = self.client.get(
             f"/api/cinema/movie_sessions/{self.movie_session.id}/"
@@ -87,3 +102,123 @@ class OrderApiTests(TestCase):
             response.data[0]["tickets_available"],
             self.cinema_hall.capacity - 1,
         )
+
+    def test_get_orders_query_count(self):
+        for seat in range(1, 4):
+            order = Order.objects.create(user=self.user)
+            Ticket.objects.create(
+                movie_session=self.movie_session, row=3, seat=seat, order=order
+            )
+        self.client.force_authenticate(user=self.user)
+        with self.assertNumQueries(3):
+            orders_response = self.client.get("/api/cinema/orders/")
+        self.assertEqual(orders_response.data["count"], 4)
+
+    def test_get_orders_only_for_authenticated_user(self):
+        other_user = User.objects.create(username="other")
+        self.client.force_authenticate(user=other_user)
+        orders_response = self.client.get("/api/cinema/orders/")
+        self.assertEqual(orders_response.status_code, status.HTTP_200_OK)
+        self.assertEqual(orders_response.data["count"], 0)
+
+    def test_post_order(self):
+        self.client.force_authenticate(user=self.user)
+        response = self.client.post(
+            "/api/cinema/orders/",
+            {
+                "tickets": [
+                    {
+                        "row": 1,
+                        "seat": 1,
+                        "movie_session": self.movie_session.id,
+                    },
+                    {
+                        "row": 1,
+                        "seat": 2,
+                        "movie_session": self.movie_session.id,
+                    },
+                ]
+            },
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        order = Order.objects.get(id=response.data["id"])
+        self.assertEqual(order.user, self.user)
+        self.assertEqual(order.tickets.count(), 2)
+
+    def test_post_order_with_taken_seat(self):
+        self.client.force_authenticate(user=self.user)
+        response = self.client.post(
+            "/api/cinema/orders/",
+            {
+                "tickets": [
+                    {
+                        "row": self.ticket.row,
+                        "seat": self.ticket.seat,
+                        "movie_session": self.movie_session.id,
+                    },
+                ]
+            },
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(Order.objects.count(), 1)
+
+    def test_post_order_with_seat_out_of_range(self):
+        self.client.force_authenticate(user=self.user)
+        response = self.client.post(
+            "/api/cinema/orders/",
+            {
+                "tickets": [
+                    {
+                        "row": 11,
+                        "seat": 1,
+                        "movie_session": self.movie_session.id,
+                    },
+                ]
+            },
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(Order.objects.count(), 1)
+
+    def test_post_order_with_duplicated_seat(self):
+        self.client.force_authenticate(user=self.user)
+        ticket = {"row": 1, "seat": 1, "movie_session": self.movie_session.id}
+        response = self.client.post(
+            "/api/cinema/orders/",
+            {"tickets": [ticket, ticket]},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(Order.objects.count(), 1)
+        self.assertEqual(Ticket.objects.count(), 1)
+
+    def test_get_orders_with_page_size(self):
+        Order.objects.create(user=self.user)
+        self.client.force_authenticate(user=self.user)
+        orders_response = self.client.get("/api/cinema/orders/?page_size=1")
+        self.assertEqual(orders_response.status_code, status.HTTP_200_OK)
+        self.assertEqual(orders_response.data["count"], 2)
+        self.assertEqual(len(orders_response.data["results"]), 1)
+
+    def test_derived_order_list_prefetches_query_count(self):
+        for seat in range(1, 4):
+            order = Order.objects.create(user=self.user)
+            Ticket.objects.create(
+                movie_session=self.movie_session, row=4, seat=seat, order=order
+            )
+        select_related, prefetches = (
+            AutoPrefetchViewSetMixin.get_related_lookups(OrderListSerializer)
+        )
+        self.assertEqual(select_related, ())
+        self.assertIs(
+            AutoPrefetchViewSetMixin.get_related_lookups(OrderListSerializer),
+            AutoPrefetchViewSetMixin.get_related_lookups(OrderListSerializer),
+        )
+        orders = Order.objects.prefetch_related(
+            *AutoPrefetchViewSetMixin.build_prefetches(prefetches)
+        )
+        with self.assertNumQueries(2):
+            data = OrderListSerializer(orders, many=True).data
+        self.assertEqual(len(data), 4)
@@ -1,6 +1,28 @@
-from rest_framework import viewsets
+from datetime import datetime, timedelta
+
+from django.conf import settings
+from django.db.models import F, Count, Exists, OuterRef, Prefetch
+from django.utils import timezone
+from rest_framework import mixins, serializers, viewsets
+from rest_framework.pagination import (
+    LimitOffsetPagination,
+    PageNumberPagination,
+)
+from rest_framework.permissions import IsAuthenticated
 
-from cinema.models import Genre, Actor, CinemaHall, Movie, MovieSession
+from cinema.mixins import (
+    AutoPrefetchViewSetMixin,
+    SerializerActionClassesMixin,
+)
+from cinema.models import (
+    Genre,
+    Actor,
+    CinemaHall,
+    Movie,
+    MovieSession,
+    Ticket,
+    Order,
+)
 
 from cinema.serializers import (
     GenreSerializer,
@@ -12,6 +34,8 @@ from cinema.serializers import (
     MovieDetailSerializer,
     MovieSessionDetailSerializer,
     MovieListSerializer,
+    OrderSerializer,
+    OrderListSerializer,
 )
 
 
@@ -30,29 +54,167 @@ class CinemaHallViewSet(viewsets.ModelViewSet):
     serializer_class = CinemaHallSerializer
 
 
-class MovieViewSet(viewsets.ModelViewSet):
+class MovieViewSet(
+    AutoPrefetchViewSetMixin,
+    SerializerActionClassesMixin,
+    viewsets.ModelViewSet,
+):
     queryset = Movie.objects.all()
     serializer_class = MovieSerializer
-
-    def get_serializer_class(self):
-        if self.action == "list":
-            return MovieListSerializer
-
-        if self.action == "retrieve":
-            return MovieDetailSerializer
-
-        return MovieSerializer
-
-
-class MovieSessionViewSet(viewsets.ModelViewSet):
+    serializer_action_classes = {
+        "list": MovieListSerializer,
+        "retrieve": MovieDetailSerializer,
+    }
+
+    @staticmethod
+    def _params_to_ints(query_string):
+        return list(map(int, filter(str.isdecimal, query_string.split(","))))
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        if self.action != "list":
+            return queryset
+
+        title = self.request.query_params.get("title")
+        genres = self.request.query_params.get("genres")
+        actors = self.request.query_params.get("actors")
+
+        if title:
+            queryset = queryset.filter(title__icontains=title)
+
+        if genres:
+            genres_ids = self._params_to_ints(genres)
+            queryset = queryset.filter(
+                Exists(
+                    Movie.genres.through.objects.filter(
+                        movie_id=OuterRef("pk"), genre_id__in=genres_ids
+                    )
+                )
+            )
+
+        if actors:
+            actors_ids = self._params_to_ints(actors)
+            queryset = queryset.filter(
+                Exists(
+                    Movie.actors.through.objects.filter(
+                        movie_id=OuterRef("pk"), actor_id__in=actors_ids
+                    )
+                )
+            )
+
+        return queryset
+
+
+class MovieSessionPagination(LimitOffsetPagination):
+    max_limit = 100
+
+
+class MovieSessionViewSet(
+    AutoPrefetchViewSetMixin,
+    SerializerActionClassesMixin,
+    viewsets.ModelViewSet,
+):
     queryset = MovieSession.objects.all()
     serializer_class = MovieSessionSerializer
+    pagination_class = MovieSessionPagination
+    serializer_action_classes = {
+        "list": MovieSessionListSerializer,
+        "retrieve": MovieSessionDetailSerializer,
+    }
 
-    def get_serializer_class(self):
-        if self.action == "list":
-            return MovieSessionListSerializer
+    def get_queryset(self):
+        queryset = super().get_queryset()
 
-        if self.action == "retrieve":
-            return MovieSessionDetailSerializer
+        if self.action == "list":
+            queryset = queryset.annotate(
+                capacity=(
+                    F("cinema_hall__rows") * F("cinema_hall__seats_in_row")
+                ),
+                tickets_available=F("capacity") - Count("tickets"),
+            )
+
+        return queryset
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        if self.action != "list":
+            return queryset
+
+        date = self.request.query_params.get("date")
+        movie = self.request.query_params.get("movie")
+
+        if date:
+            try:
+                start = datetime.strptime(date, "%Y-%m-%d")
+            except ValueError:
+                raise serializers.ValidationError(
+                    {"date": "Date must be in year-month-day format."}
+                )
+            if settings.USE_TZ:
+                start = timezone.make_aware(start)
+            queryset = queryset.filter(
+                show_time__gte=start,
+                show_time__lt=start + timedelta(days=1),
+            )
+
+        if movie:
+            if not movie.isdecimal():
+                raise serializers.ValidationError(
+                    {"movie": "Movie must be provided by its id."}
+                )
+            queryset = queryset.filter(movie_id=movie)
+
+        return queryset
+
+
+class OrderPagination(PageNumberPagination):
+    page_size = 10
+    page_size_query_param = "page_size"
+    max_page_size = 100
+
+
+class OrderViewSet(
+    AutoPrefetchViewSetMixin,
+    SerializerActionClassesMixin,
+    mixins.ListModelMixin,
+    mixins.CreateModelMixin,
+    viewsets.GenericViewSet,
+):
+    queryset = Order.objects.all()
+    serializer_class = OrderSerializer
+    serializer_action_classes = {
+        "list": OrderListSerializer,
+    }
+    custom_prefetch_lookups = ("tickets",)
+    pagination_class = OrderPagination
+    permission_classes = (IsAuthenticated,)
+
+    def get_queryset(self):
+        queryset = super().get_queryset().filter(user=self.request.user)
 
-        return MovieSessionSerializer
+        if self.action == "list":
+            queryset = queryset.prefetch_related(
+                Prefetch(
+                    "tickets",
+                    queryset=Ticket.objects.select_related(
+                        "movie_session__movie", "movie_session__cinema_hall"
+                    ).only(
+                        "id",
+                        "row",
+                        "seat",
+                        "order_id",
+                        "movie_session__id",
+                        "movie_session__show_time",
+                        "movie_session__movie__title",
+                        "movie_session__cinema_hall__name",
+                        "movie_session__cinema_hall__rows",
+                        "movie_session__cinema_hall__seats_in_row",
+                    ),
+                    to_attr="prefetched_tickets",
+                )
+            )
+
+        return queryset
+
+    def perform_create(self, serializer):
+        serializer.save(user=self.request.user)